@@ -1,3 +1,5 @@
+import importlib.util
+
 import streamlit as st
 import pandas as pd 
 import plotly.express as px
@@ -5,6 +7,18 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 
+from college_data import (
+    GROUP_COLORS,
+    RISK_BIN_EDGES,
+    load_css,
+    read_salary_source,
+    top_k,
+)
+
+# Optional: pandas imports numba itself when engine='numba' is used, so only
+# check it is installed rather than paying for the import on every cold start
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
+
 
 # Page config
 st.set_page_config(
@@ -14,85 +28,394 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+
 # Custom CSS for AURA theme
-st.markdown("""
-<style>
-    .main-header {
-        text-align: center;
-        padding: 2rem 0;
-        background: linear-gradient(135deg, #1e3c72 0%, #2a5298 100%);
-        border-radius: 10px;
-        margin-bottom: 2rem;
-        color: white;
-    }
-    
-    .metric-container {
-        background: rgba(255, 255, 255, 0.05);
-        border-radius: 10px;
-        padding: 1rem;
-        margin: 0.5rem 0;
-        border: 1px solid rgba(255, 255, 255, 0.1);
-    }
-    
-    .risk-high { color: #EF4444; font-weight: bold; }
-    .risk-medium { color: #F59E0B; font-weight: bold; }
-    .risk-low { color: #10B981; font-weight: bold; }
-    
-    .salary-insight {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 1.5rem;
-        border-radius: 10px;
-        color: white;
-        margin: 1rem 0;
-    }
-    
-    .group-stem { border-left: 4px solid #10B981; }
-    .group-business { border-left: 4px solid #3B82F6; }
-    .group-hass { border-left: 4px solid #8B5CF6; }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(load_css('./assets/home.css'), unsafe_allow_html=True)
 
 
 # Data loading and processing functions
+# The numba groupby engine costs seconds of JIT compile on first use, so only
+# switch to it once the dataset is large enough for that to pay off
+NUMBA_GROUPBY_MIN_ROWS = 1_000_000
+
+
 @st.cache_data
 def load_college_data():
-    """Load and clean college major salary data"""
-    df = pd.read_csv('./data/college_salary_data.csv')
-
-    # Calculate additional metrics
-    df['Mid-Career 10th Percentile Salary'] = df['Mid-Career Median Salary'] * 0.7
-    df['Mid-Career 90th Percentile Salary'] = df['Mid-Career Median Salary'] * 1.8
-    df['Spread'] = df['Mid-Career 90th Percentile Salary'] - df['Mid-Career 10th Percentile Salary']
-    df['Salary Growth'] = df['Mid-Career Median Salary'] - df['Starting Median Salary']
-    df['Growth Percentage'] = (df['Salary Growth'] / df['Starting Median Salary']) * 100
-    
-    # Risk categories based on spread
-    df['Risk Level'] = pd.cut(df['Spread'], 
-                             bins=[0, 60000, 80000, float('inf')], 
-                             labels=['Low', 'Medium', 'High'])
-    
-    return df
+    """Load and clean college major salary data, plus per-group averages"""
+    df = read_salary_source()
+
+    # Calculate additional metrics on the raw arrays in one pass
+    start = df['Starting Median Salary'].to_numpy(dtype=np.float32)
+    mid = df['Mid-Career Median Salary'].to_numpy(dtype=np.float32)
+    p10 = mid * np.float32(0.7)
+    p90 = mid * np.float32(1.8)
+    spread = p90 - p10
+    growth = mid - start
+    growth_pct = growth / start * np.float32(100.0)
+
+    # Risk categories based on spread: (0, 60k] Low, (60k, 80k] Medium, above High
+    risk_codes = np.searchsorted(RISK_BIN_EDGES, spread).astype(np.int8)
+
+    df = df.assign(**{
+        'Mid-Career 10th Percentile Salary': p10,
+        'Mid-Career 90th Percentile Salary': p90,
+        'Spread': spread,
+        'Salary Growth': growth,
+        'Growth Percentage': growth_pct,
+        'Risk Level': pd.Categorical.from_codes(risk_codes, categories=['Low', 'Medium', 'High'], ordered=True),
+        '_group_color': df['Group'].map(GROUP_COLORS).astype('category'),
+    })
+
+    # Dataset-wide group averages; no filter affects them, so compute them once here
+    use_numba = HAS_NUMBA and len(df) >= NUMBA_GROUPBY_MIN_ROWS
+    group_stats = df.groupby('Group', observed=True, sort=False)[
+        ['Starting Median Salary', 'Mid-Career Median Salary', 'Growth Percentage']
+    ].mean(
+        engine='numba' if use_numba else None,
+        engine_kwargs={'nogil': True} if use_numba else None
+    ).round(0)
+
+    return df, group_stats
+
 
+# Above this many rows, charts ship server-side aggregates instead of every point
+SCATTER_POINT_LIMIT = 2000
+
+
+def density_heatmap(df, x, y, title, bins=(40, 30)):
+    """Bin a dense scatter into a 2D count grid so the browser gets bins, not rows"""
+    counts, x_edges, y_edges = np.histogram2d(df[x].to_numpy(), df[y].to_numpy(), bins=bins)
+    fig = go.Figure(go.Heatmap(
+        z=np.where(counts.T > 0, counts.T, np.nan),
+        x=(x_edges[:-1] + x_edges[1:]) / 2,
+        y=(y_edges[:-1] + y_edges[1:]) / 2,
+        colorscale='Viridis',
+        colorbar=dict(title='Majors'),
+        hovertemplate=f'{x}: %{{x:$,.0f}}<br>{y}: %{{y:$,.0f}}<br>Majors: %{{z}}<extra></extra>'
+    ))
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y)
+    return fig
+
+
+def box_summary(df, x, y, title, color_map):
+    """Box plot drawn from precomputed quartiles instead of the raw rows"""
+    quartiles = df.groupby(x, observed=True)[y].describe()
+    fig = go.Figure()
+    for group, q in quartiles.iterrows():
+        fig.add_trace(go.Box(
+            name=group, x=[group],
+            q1=[q['25%']], median=[q['50%']], q3=[q['75%']],
+            lowerfence=[q['min']], upperfence=[q['max']],
+            marker_color=color_map.get(group)
+        ))
+    fig.update_layout(title=title, xaxis_title=x, yaxis_title=y)
+    return fig
+
+
+@st.cache_resource
+def salary_scatter_layout():
+    """Static layout of the salary progression chart, validated once per process
+
+    Returned as a plain dict so each rerun builds its own figure from it rather
+    than mutating an object that cache_resource shares across sessions.
+    """
+    return go.Layout(
+        title="Salary Progression by Major Group",
+        xaxis_title='Starting Median Salary',
+        yaxis_title='Mid-Career Median Salary',
+        legend_title_text='Group',
+        height=500
+    ).to_plotly_json()
+
+
+def salary_scatter_figure(df):
+    """Salary progression scatter as a single Scattergl trace on the cached layout"""
+    growth_pct = df['Growth Percentage'].to_numpy()
+    sizeref = growth_pct.max() / 20 ** 2  # same scaling as Plotly Express with size_max=20
+
+    fig = go.Figure(layout=salary_scatter_layout())
+    fig.add_trace(go.Scattergl(
+        x=df['Starting Median Salary'].to_numpy(),
+        y=df['Mid-Career Median Salary'].to_numpy(),
+        mode='markers', showlegend=False,
+        marker=dict(color=df['_group_color'].to_numpy(), size=growth_pct, sizemode='area', sizeref=sizeref),
+        hovertext=df['Undergraduate Major'].to_numpy(),
+        customdata=df['Group'].to_numpy(),
+        hovertemplate='<b>%{hovertext}</b><br>Starting Median Salary: %{x:$,.0f}'
+                      '<br>Mid-Career Median Salary: %{y:$,.0f}'
+                      '<br>Growth Percentage: %{marker.size:.1f}%<extra>%{customdata}</extra>'
+    ))
+
+    # Empty legend-only traces keep the group colour key
+    present = set(df['Group'].unique())
+    for group, color in GROUP_COLORS.items():
+        if group in present:
+            fig.add_trace(go.Scattergl(x=[None], y=[None], mode='markers', name=group,
+                                       marker=dict(color=color, size=10)))
+    return fig
+
+
+def category_mask(series, values):
+    """Membership test on a categorical column's integer codes"""
+    wanted = series.cat.categories.get_indexer(values)
+    return np.isin(series.cat.codes.to_numpy(), wanted[wanted >= 0])
+
+
+def build_filter_mask(df, selected_groups, salary_range, risk_filter):
+    """Combine the sidebar filters into one boolean ndarray over the raw columns"""
+    start = df['Starting Median Salary'].to_numpy()
+    return (
+        category_mask(df['Group'], selected_groups) &
+        (start >= salary_range[0]) & (start <= salary_range[1]) &
+        category_mask(df['Risk Level'], risk_filter)
+    )
+
+
+@st.cache_data(max_entries=64)
+def comparison_options(_filtered_df, filter_key):
+    """Options and default picks for the major comparison, cached per filter combination
+
+    filter_key (the sidebar selections) fully determines _filtered_df, so the
+    frame itself is left unhashed.
+    """
+    options = _filtered_df['Undergraduate Major'].tolist()
+    defaults = top_k(_filtered_df, 'Mid-Career Median Salary', 3)['Undergraduate Major'].tolist()
+    return options, defaults
+
+
+@st.cache_data
+def calculate_major_stats(_df):
+    """Calculate key stats for display
 
-def calculate_major_stats(df):
-    """Calculate key stats for display"""
+    The full dataset never changes within a process, so the leading underscore
+    tells Streamlit to skip hashing the frame and compute these once.
+    """
+    df = _df
+    stat_columns = ['Starting Median Salary', 'Mid-Career Median Salary', 'Growth Percentage']
+    extremes = df[stat_columns].agg(['idxmin', 'idxmax'])
     return {
         'total_majors': len(df),
         'avg_starting_salary': df['Starting Median Salary'].mean(),
         'avg_midcareer_salary': df['Mid-Career Median Salary'].mean(),
-        'highest_starting': df.loc[df['Starting Median Salary'].idxmax()],
-        'highest_midcareer': df.loc[df['Mid-Career Median Salary'].idxmax()],
-        'lowest_starting': df.loc[df['Starting Median Salary'].idxmin()],
-        'lowest_midcareer': df.loc[df['Mid-Career Median Salary'].idxmin()],
-        'best_growth': df.loc[df['Growth Percentage'].idxmax()],
-        'group_stats': df.groupby('Group').agg({
-            'Starting Median Salary': 'mean',
-            'Mid-Career Median Salary': 'mean',
-            'Growth Percentage': 'mean'
-        }).round(0)
+        'highest_starting': df.loc[extremes.at['idxmax', 'Starting Median Salary']],
+        'highest_midcareer': df.loc[extremes.at['idxmax', 'Mid-Career Median Salary']],
+        'lowest_starting': df.loc[extremes.at['idxmin', 'Starting Median Salary']],
+        'lowest_midcareer': df.loc[extremes.at['idxmin', 'Mid-Career Median Salary']],
+        'best_growth': df.loc[extremes.at['idxmax', 'Growth Percentage']]
     }
 
 
+def metric_row_html(metrics):
+    """One HTML row of metric cards from (label, value, delta, help) tuples
+
+    Sent as a single element instead of four st.metric widgets.
+    """
+    cards = []
+    for label, value, delta, help_text in metrics:
+        delta_html = ''
+        if delta is not None:
+            delta = round(delta)
+            direction = 'up' if delta > 0 else 'down' if delta < 0 else 'flat'
+            arrow = {'up': '▲ ', 'down': '▼ ', 'flat': ''}[direction]
+            delta_html = f'<div class="metric-delta metric-delta-{direction}">{arrow}{delta:,}</div>'
+        cards.append(
+            f'<div class="metric-container" title="{help_text}">'
+            f'<div class="metric-label">{label}</div>'
+            f'<div class="metric-value">{value}</div>'
+            f'{delta_html}</div>'
+        )
+    return f'<div class="metric-row">{"".join(cards)}</div>'
+
+
+@st.fragment
+def render_analysis_tabs(filtered_df, group_stats, filter_key):
+    """Chart tabs for the filtered majors
+
+    Runs as a fragment so widgets inside the tabs (e.g. the comparison
+    multiselect) rerun only this block instead of the whole page.
+    """
+    # Tabs for different views
+    tab1, tab2, tab3, tab4 = st.tabs(["📊 Salary Comparison", "🎯 Risk Analysis", "📈 Growth Analysis", "🔍 Major Details"])
+    
+    with tab1:
+        st.subheader("💰 Starting vs Mid-Career Salary Comparison")
+        
+        if len(filtered_df) > SCATTER_POINT_LIMIT:
+            fig = density_heatmap(filtered_df, 'Starting Median Salary', 'Mid-Career Median Salary',
+                                  "Salary Progression (majors per bin)")
+        else:
+            fig = salary_scatter_figure(filtered_df)
+        
+        # Add diagonal line showing no growth
+        fig.add_shape(
+            type="line",
+            x0=filtered_df['Starting Median Salary'].min(),
+            x1=filtered_df['Starting Median Salary'].max(),
+            y0=filtered_df['Starting Median Salary'].min(),
+            y1=filtered_df['Starting Median Salary'].max(),
+            line=dict(dash="dash", color="gray"),
+        )
+        
+        fig.update_layout(height=500)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Top/Bottom performers
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.write("**🏆 Top Starting Salaries:**")
+            top_starting = top_k(filtered_df, 'Starting Median Salary', 5)[['Undergraduate Major', 'Starting Median Salary', 'Group']]
+            st.markdown('\n\n'.join(
+                f"• **{major}** ({group}): ${salary:,}"
+                for major, salary, group in top_starting.itertuples(index=False, name=None)
+            ))
+        
+        with col2:
+            st.write("**📈 Top Mid-Career Salaries:**")
+            top_midcareer = top_k(filtered_df, 'Mid-Career Median Salary', 5)[['Undergraduate Major', 'Mid-Career Median Salary', 'Group']]
+            st.markdown('\n\n'.join(
+                f"• **{major}** ({group}): ${salary:,}"
+                for major, salary, group in top_midcareer.itertuples(index=False, name=None)
+            ))
+    
+    with tab2:
+        st.subheader("⚖️ Risk vs Reward Analysis")
+        
+        # Risk distribution
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            if len(filtered_df) > SCATTER_POINT_LIMIT:
+                fig_risk = density_heatmap(filtered_df, 'Mid-Career Median Salary', 'Spread',
+                                           "Risk vs Reward (majors per bin)")
+            else:
+                fig_risk = px.scatter(
+                    filtered_df,
+                    x='Mid-Career Median Salary',
+                    y='Spread',
+                    color='Risk Level',
+                    hover_name='Undergraduate Major',
+                    hover_data={
+                        'Mid-Career Median Salary': ':$,.0f',
+                        'Spread': ':$,.0f',
+                        'Group': True
+                    },
+                    title="Risk vs Reward: Salary Spread Analysis",
+                    render_mode='webgl',
+                    color_discrete_map={
+                        'Low': '#10B981',
+                        'Medium': '#F59E0B',
+                        'High': '#EF4444'
+                    }
+                )
+            fig_risk.update_layout(height=500)
+            st.plotly_chart(fig_risk, use_container_width=True)
+        
+        with col2:
+            # Risk level distribution
+            risk_counts = filtered_df['Risk Level'].value_counts()
+            fig_pie = px.pie(
+                values=risk_counts.values,
+                names=risk_counts.index,
+                title="Risk Level Distribution",
+                color_discrete_map={
+                    'Low': '#10B981',
+                    'Medium': '#F59E0B',
+                    'High': '#EF4444'
+                }
+            )
+            st.plotly_chart(fig_pie, use_container_width=True)
+            
+            # Risk insights
+            st.write("**Risk Level Guide:**")
+            st.write("🟢 **Low Risk**: Predictable salary range")
+            st.write("🟡 **Medium Risk**: Moderate variability") 
+            st.write("🔴 **High Risk**: High potential but uncertain")
+    
+    with tab3:
+        st.subheader("📈 Career Growth Analysis")
+        
+        # Growth comparison by group
+        if len(filtered_df) > SCATTER_POINT_LIMIT:
+            fig_growth = box_summary(filtered_df, 'Group', 'Growth Percentage',
+                                     "Salary Growth Distribution by Major Group", GROUP_COLORS)
+        else:
+            fig_growth = px.box(
+                filtered_df,
+                x='Group',
+                y='Growth Percentage',
+                color='Group',
+                title="Salary Growth Distribution by Major Group",
+                color_discrete_map=GROUP_COLORS
+            )
+        fig_growth.update_layout(height=400)
+        st.plotly_chart(fig_growth, use_container_width=True)
+        
+        # Growth champions
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.write("**🚀 Best Growth Potential:**")
+            best_growth = top_k(filtered_df, 'Growth Percentage', 5)[['Undergraduate Major', 'Growth Percentage', 'Salary Growth']]
+            st.markdown('\n\n'.join(
+                f"• **{major}**: +{growth_pct:.0f}% (${growth:,.0f})"
+                for major, growth_pct, growth in best_growth.itertuples(index=False, name=None)
+            ))
+        
+        with col2:
+            st.write("**💼 Group Performance:**")
+            st.markdown('\n\n'.join(
+                f"**{group}**: {growth_pct:.0f}% avg growth"
+                for group, growth_pct in group_stats['Growth Percentage'].items()
+            ))
+    
+    with tab4:
+        st.subheader("🔍 Detailed Major Analysis")
+        
+        # Search and compare majors
+        major_options, default_majors = comparison_options(filtered_df, filter_key)
+        selected_majors = st.multiselect(
+            "Compare specific majors:",
+            options=major_options,
+            default=default_majors
+        )
+        
+        if selected_majors:
+            comparison_df = filtered_df[filtered_df['Undergraduate Major'].isin(selected_majors)]
+            
+            # Create comparison chart
+            # One trace per salary stage, with the selected majors along the x axis
+            compare_majors = comparison_df['Undergraduate Major'].tolist()
+            fig_compare = go.Figure([
+                go.Bar(
+                    name=stage,
+                    x=compare_majors,
+                    y=comparison_df[column].to_numpy(),
+                    texttemplate='$%{y:,.0f}',
+                    textposition='auto'
+                )
+                for stage, column in [('Starting Salary', 'Starting Median Salary'),
+                                      ('Mid-Career Salary', 'Mid-Career Median Salary')]
+            ])
+            
+            fig_compare.update_layout(
+                title="Direct Major Comparison",
+                barmode='group',
+                height=400
+            )
+            st.plotly_chart(fig_compare, use_container_width=True)
+            
+            # Detailed comparison table
+            st.write("**📋 Detailed Comparison:**")
+            display_columns = ['Undergraduate Major', 'Group', 'Starting Median Salary', 
+                             'Mid-Career Median Salary', 'Growth Percentage', 'Risk Level']
+            st.dataframe(comparison_df[display_columns].style.format({
+                'Starting Median Salary': '${:,.0f}',
+                'Mid-Career Median Salary': '${:,.0f}',
+                'Growth Percentage': '{:.1f}%'
+            }), use_container_width=True)
+
+
 def main():
     # Header
     st.markdown("""
@@ -104,7 +427,7 @@ def main():
     """, unsafe_allow_html=True)
     
     # Load data
-    df = load_college_data()
+    df, group_stats = load_college_data()
     stats = calculate_major_stats(df)
 
     # Sidebar filters
@@ -133,232 +456,32 @@ def main():
         default=['Low', 'Medium', 'High']
     )
     
-    # Filter dataframe
-    filtered_df = df[
-        (df['Group'].isin(selected_groups)) &
-        (df['Starting Median Salary'] >= salary_range[0]) &
-        (df['Starting Median Salary'] <= salary_range[1]) &
-        (df['Risk Level'].isin(risk_filter))
-    ].copy()
+    # Filter dataframe (read-only downstream, so no copy)
+    filtered_df = df[build_filter_mask(df, selected_groups, salary_range, risk_filter)]
+    filter_key = (tuple(selected_groups), tuple(salary_range), tuple(risk_filter))
     
     # Overview Metrics
     st.header("📊 Key Insights")
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric(
-            label="🎯 Majors Analyzed", 
-            value=f"{len(filtered_df)}/{stats['total_majors']}",
-            help="Number of majors in current filter vs. total"
-        )
-    
-    with col2:
-        avg_start = filtered_df['Starting Median Salary'].mean() if len(filtered_df) > 0 else 0
-        st.metric(
-            label="💰 Avg Starting Salary",
-            value=f"${avg_start:,.0f}",
-            delta=f"{avg_start - stats['avg_starting_salary']:,.0f}",
-            help="Average starting salary for filtered majors"
-        )
-    
-    with col3:
-        avg_mid = filtered_df['Mid-Career Median Salary'].mean() if len(filtered_df) > 0 else 0
-        st.metric(
-            label="📈 Avg Mid-Career Salary",
-            value=f"${avg_mid:,.0f}",
-            delta=f"{avg_mid - stats['avg_midcareer_salary']:,.0f}",
-            help="Average mid-career salary for filtered majors"
-        )
+    has_rows = len(filtered_df) > 0
+    avg_start = filtered_df['Starting Median Salary'].mean() if has_rows else 0
+    avg_mid = filtered_df['Mid-Career Median Salary'].mean() if has_rows else 0
+    avg_growth = filtered_df['Growth Percentage'].mean() if has_rows else 0
     
-    with col4:
-        avg_growth = filtered_df['Growth Percentage'].mean() if len(filtered_df) > 0 else 0
-        st.metric(
-            label="🚀 Avg Salary Growth",
-            value=f"{avg_growth:.0f}%",
-            help="Average percentage salary growth from start to mid-career"
-        )
+    st.html(metric_row_html([
+        ("🎯 Majors Analyzed", f"{len(filtered_df)}/{stats['total_majors']}", None,
+         "Number of majors in current filter vs. total"),
+        ("💰 Avg Starting Salary", f"${avg_start:,.0f}", avg_start - stats['avg_starting_salary'],
+         "Average starting salary for filtered majors"),
+        ("📈 Avg Mid-Career Salary", f"${avg_mid:,.0f}", avg_mid - stats['avg_midcareer_salary'],
+         "Average mid-career salary for filtered majors"),
+        ("🚀 Avg Salary Growth", f"{avg_growth:.0f}%", None,
+         "Average percentage salary growth from start to mid-career"),
+    ]))
     
     # Main visualizations
     if len(filtered_df) > 0:
-        # Tabs for different views
-        tab1, tab2, tab3, tab4 = st.tabs(["📊 Salary Comparison", "🎯 Risk Analysis", "📈 Growth Analysis", "🔍 Major Details"])
-        
-        with tab1:
-            st.subheader("💰 Starting vs Mid-Career Salary Comparison")
-            
-            fig = px.scatter(
-                filtered_df,
-                x='Starting Median Salary',
-                y='Mid-Career Median Salary',
-                color='Group',
-                size='Growth Percentage',
-                hover_name='Undergraduate Major',
-                hover_data={
-                    'Starting Median Salary': ':$,.0f',
-                    'Mid-Career Median Salary': ':$,.0f',
-                    'Growth Percentage': ':.1f%'
-                },
-                title="Salary Progression by Major Group",
-                color_discrete_map={
-                    'STEM': '#10B981',
-                    'Business': '#3B82F6', 
-                    'HASS': '#8B5CF6'
-                }
-            )
-            
-            # Add diagonal line showing no growth
-            fig.add_shape(
-                type="line",
-                x0=filtered_df['Starting Median Salary'].min(),
-                x1=filtered_df['Starting Median Salary'].max(),
-                y0=filtered_df['Starting Median Salary'].min(),
-                y1=filtered_df['Starting Median Salary'].max(),
-                line=dict(dash="dash", color="gray"),
-            )
-            
-            fig.update_layout(height=500)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Top/Bottom performers
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.write("**🏆 Top Starting Salaries:**")
-                top_starting = filtered_df.nlargest(5, 'Starting Median Salary')[['Undergraduate Major', 'Starting Median Salary', 'Group']]
-                for _, row in top_starting.iterrows():
-                    st.write(f"• **{row['Undergraduate Major']}** ({row['Group']}): ${row['Starting Median Salary']:,}")
-            
-            with col2:
-                st.write("**📈 Top Mid-Career Salaries:**")
-                top_midcareer = filtered_df.nlargest(5, 'Mid-Career Median Salary')[['Undergraduate Major', 'Mid-Career Median Salary', 'Group']]
-                for _, row in top_midcareer.iterrows():
-                    st.write(f"• **{row['Undergraduate Major']}** ({row['Group']}): ${row['Mid-Career Median Salary']:,}")
-        
-        with tab2:
-            st.subheader("⚖️ Risk vs Reward Analysis")
-            
-            # Risk distribution
-            col1, col2 = st.columns([2, 1])
-            
-            with col1:
-                fig_risk = px.scatter(
-                    filtered_df,
-                    x='Mid-Career Median Salary',
-                    y='Spread',
-                    color='Risk Level',
-                    hover_name='Undergraduate Major',
-                    hover_data={
-                        'Mid-Career Median Salary': ':$,.0f',
-                        'Spread': ':$,.0f',
-                        'Group': True
-                    },
-                    title="Risk vs Reward: Salary Spread Analysis",
-                    color_discrete_map={
-                        'Low': '#10B981',
-                        'Medium': '#F59E0B',
-                        'High': '#EF4444'
-                    }
-                )
-                fig_risk.update_layout(height=500)
-                st.plotly_chart(fig_risk, use_container_width=True)
-            
-            with col2:
-                # Risk level distribution
-                risk_counts = filtered_df['Risk Level'].value_counts()
-                fig_pie = px.pie(
-                    values=risk_counts.values,
-                    names=risk_counts.index,
-                    title="Risk Level Distribution",
-                    color_discrete_map={
-                        'Low': '#10B981',
-                        'Medium': '#F59E0B',
-                        'High': '#EF4444'
-                    }
-                )
-                st.plotly_chart(fig_pie, use_container_width=True)
-                
-                # Risk insights
-                st.write("**Risk Level Guide:**")
-                st.write("🟢 **Low Risk**: Predictable salary range")
-                st.write("🟡 **Medium Risk**: Moderate variability") 
-                st.write("🔴 **High Risk**: High potential but uncertain")
-        
-        with tab3:
-            st.subheader("📈 Career Growth Analysis")
-            
-            # Growth comparison by group
-            fig_growth = px.box(
-                filtered_df,
-                x='Group',
-                y='Growth Percentage',
-                color='Group',
-                title="Salary Growth Distribution by Major Group",
-                color_discrete_map={
-                    'STEM': '#10B981',
-                    'Business': '#3B82F6', 
-                    'HASS': '#8B5CF6'
-                }
-            )
-            fig_growth.update_layout(height=400)
-            st.plotly_chart(fig_growth, use_container_width=True)
-            
-            # Growth champions
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.write("**🚀 Best Growth Potential:**")
-                best_growth = filtered_df.nlargest(5, 'Growth Percentage')[['Undergraduate Major', 'Growth Percentage', 'Salary Growth']]
-                for _, row in best_growth.iterrows():
-                    st.write(f"• **{row['Undergraduate Major']}**: +{row['Growth Percentage']:.0f}% (${row['Salary Growth']:,})")
-            
-            with col2:
-                st.write("**💼 Group Performance:**")
-                for group, stats_row in stats['group_stats'].iterrows():
-                    st.write(f"**{group}**: {stats_row['Growth Percentage']:.0f}% avg growth")
-        
-        with tab4:
-            st.subheader("🔍 Detailed Major Analysis")
-            
-            # Search and compare majors
-            selected_majors = st.multiselect(
-                "Compare specific majors:",
-                options=filtered_df['Undergraduate Major'].tolist(),
-                default=filtered_df.nlargest(3, 'Mid-Career Median Salary')['Undergraduate Major'].tolist()[:3]
-            )
-            
-            if selected_majors:
-                comparison_df = filtered_df[filtered_df['Undergraduate Major'].isin(selected_majors)].copy()
-                
-                # Create comparison chart
-                fig_compare = go.Figure()
-                
-                for _, row in comparison_df.iterrows():
-                    fig_compare.add_trace(go.Bar(
-                        name=row['Undergraduate Major'],
-                        x=['Starting Salary', 'Mid-Career Salary'],
-                        y=[row['Starting Median Salary'], row['Mid-Career Median Salary']],
-                        text=[f"${row['Starting Median Salary']:,}", f"${row['Mid-Career Median Salary']:,}"],
-                        textposition='auto'
-                    ))
-                
-                fig_compare.update_layout(
-                    title="Direct Major Comparison",
-                    barmode='group',
-                    height=400
-                )
-                st.plotly_chart(fig_compare, use_container_width=True)
-                
-                # Detailed comparison table
-                st.write("**📋 Detailed Comparison:**")
-                display_columns = ['Undergraduate Major', 'Group', 'Starting Median Salary', 
-                                 'Mid-Career Median Salary', 'Growth Percentage', 'Risk Level']
-                st.dataframe(comparison_df[display_columns].style.format({
-                    'Starting Median Salary': '${:,.0f}',
-                    'Mid-Career Median Salary': '${:,.0f}',
-                    'Growth Percentage': '{:.1f}%'
-                }), use_container_width=True)
-    
+        render_analysis_tabs(filtered_df, group_stats, filter_key)
     else:
         st.warning("No majors match your current filters. Try adjusting the criteria.")
     
@@ -0,0 +1,81 @@
+"""Data sources and helpers shared by the dashboard pages"""
+import os
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+from pyarrow import csv as pacsv
+
+
+DATA_CSV_PATH = './data/college_salary_data.csv'
+DATA_PARQUET_PATH = './data/college_salary_data.parquet'  # built by scripts/build_parquet.py
+
+SALARY_COLUMNS = [
+    'Starting Median Salary',
+    'Mid-Career Median Salary',
+    'Mid-Career 10th Percentile Salary',
+    'Mid-Career 90th Percentile Salary',
+]
+
+# Typed at parse time; dictionary-encoded strings arrive in pandas as categoricals.
+# Salaries are written like 46000.00, so they parse as float and are narrowed in Arrow.
+CSV_COLUMN_TYPES = {
+    'Undergraduate Major': pa.dictionary(pa.int32(), pa.string()),
+    'Group': pa.dictionary(pa.int32(), pa.string()),
+    **{column: pa.float64() for column in SALARY_COLUMNS},
+}
+
+RISK_BIN_EDGES = np.array([60000.0, 80000.0], dtype=np.float32)
+
+GROUP_COLORS = {
+    'STEM': '#10B981',
+    'Business': '#3B82F6',
+    'HASS': '#8B5CF6'
+}
+
+
+@st.cache_resource
+def load_css(path):
+    """Read a stylesheet once per process, wrapped for st.markdown"""
+    with open(path) as f:
+        return f"<style>\n{f.read()}</style>"
+
+
+def read_salary_source():
+    """Read the raw salary table, preferring the Parquet copy unless the CSV is newer"""
+    if (os.path.exists(DATA_PARQUET_PATH) and
+            os.path.getmtime(DATA_PARQUET_PATH) >= os.path.getmtime(DATA_CSV_PATH)):
+        return pd.read_parquet(DATA_PARQUET_PATH, engine='pyarrow')
+    table = pacsv.read_csv(
+        DATA_CSV_PATH,
+        convert_options=pacsv.ConvertOptions(column_types=CSV_COLUMN_TYPES)
+    )
+    table = table.cast(pa.schema([
+        field.with_type(pa.int32()) if field.name in SALARY_COLUMNS else field
+        for field in table.schema
+    ]))
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    # Dictionary columns keep first-appearance order; sort the categories like the
+    # pd.read_csv(dtype='category') that builds the Parquet copy, so group-wise
+    # charts lay out the same whichever file was read
+    return df.assign(**{
+        column: df[column].cat.reorder_categories(sorted(df[column].cat.categories))
+        for column in ('Undergraduate Major', 'Group')
+    })
+
+
+def top_k(df, column, k):
+    """Rows holding the k largest values of column, largest first
+
+    np.partition finds the k-th largest value in O(N) and only the rows at or
+    above it get sorted; ties keep their original row order like
+    nlargest(keep='first'), including ties straddling the cut-off.
+    """
+    values = df[column].to_numpy()
+    k = min(k, len(values))
+    if k == 0:
+        return df.iloc[:0]
+    threshold = np.partition(values, -k)[-k]
+    idx = np.flatnonzero(values >= threshold)
+    return df.iloc[idx[np.argsort(-values[idx], kind='stable')[:k]]]
@@ -1,3 +1,5 @@
+import re
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
@@ -5,6 +7,8 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 
+from college_data import GROUP_COLORS, RISK_BIN_EDGES, load_css, read_salary_source, top_k
+
 
 st.set_page_config(
     page_title="Career Guidance",
@@ -12,178 +16,234 @@ st.set_page_config(
     layout="wide"
 )
 
+
 # Custom CSS (matching AURA theme)
-st.markdown("""
-<style>
-    .guidance-header {
-        text-align: center;
-        padding: 2rem 0;
-        background: linear-gradient(135deg, #2a5298 0%, #1e3c72 100%);
-        border-radius: 10px;
-        margin-bottom: 2rem;
-        color: white;
-    }
-    
-    .recommendation-card {
-        background: rgba(255, 255, 255, 0.05);
-        border-radius: 10px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        border-left: 4px solid #10B981;
-        backdrop-filter: blur(10px);
-    }
-    
-    .risk-recommendation {
-        border-left-color: #F59E0B;
-    }
-    
-    .growth-recommendation {
-        border-left-color: #3B82F6;
-    }
-    
-    .personality-match {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 1.5rem;
-        border-radius: 10px;
-        color: white;
-        margin: 1rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(load_css('./assets/career_guidance.css'), unsafe_allow_html=True)
+
+
+OUTLOOK_COLORS = {'Very High': '#10B981', 'High': '#22C55E', 'Moderate': '#F59E0B', 'Low': '#EF4444'}
+
+GUIDANCE_HEADER_HTML = """
+<div class="guidance-header">
+    <h1>🎯 Career Guidance & Decision Tool</h1>
+    <h2>Personalized Major Recommendations</h2>
+    <p>Find the right major based on your priorities, personality, and career goals</p>
+</div>
+"""
 
 
 # Enhanced data loading w career insights (sample data added)
-@st.cache_data
+@st.cache_resource
 def load_enhanced_college_data():
     """Load college data w additional career guidance features (sample data)"""
     data = {
         # Enhanced features for career guidance
-        'Job_Satisfaction_Score': [
+        'Job_Satisfaction_Score': np.array([
             7.2, 8.1, 6.8, 7.5, 7.8, 8.3, 7.9, 6.9, 7.6, 7.8,
             7.4, 7.1, 8.2, 8.5, 7.0, 7.7, 8.9, 7.9, 8.1, 7.3,
             7.1, 7.2, 6.9, 7.4, 7.8, 7.0, 7.6, 6.8, 7.7, 7.9,
             7.3, 7.0, 6.8, 8.0, 7.8, 8.2, 8.1, 7.4, 8.3, 8.1,
             7.5, 7.8, 7.9, 7.6, 7.2, 8.0, 7.1, 7.6, 7.5, 8.3
-        ],
-        'Work_Life_Balance': [
+        ], dtype=np.float32),
+        'Work_Life_Balance': np.array([
             6.5, 6.8, 7.2, 7.8, 6.9, 8.1, 7.1, 6.2, 6.5, 7.0,
             7.0, 7.5, 6.8, 7.2, 6.8, 7.0, 8.5, 6.9, 8.0, 7.1,
             6.3, 7.5, 7.3, 7.2, 7.8, 7.2, 7.9, 7.0, 6.9, 7.1,
             7.4, 7.6, 6.8, 7.3, 6.7, 8.3, 7.8, 7.6, 8.2, 7.4,
             7.2, 7.9, 8.1, 7.7, 7.5, 8.4, 7.3, 7.6, 7.5, 8.1
-        ],
-        'Job_Growth_Outlook': [
+        ], dtype=np.float32),
+        # Ordered categorical so the outlook sorts Low -> Very High
+        'Job_Growth_Outlook': pd.Categorical([
             'Moderate', 'High', 'Moderate', 'Low', 'Moderate', 'Low', 'High', 'Moderate',
             'High', 'High', 'High', 'Low', 'Very High', 'Very High', 'Moderate', 'Moderate',
             'Moderate', 'High', 'Low', 'High', 'Moderate', 'Low', 'Low', 'Moderate',
             'Moderate', 'High', 'Low', 'High', 'High', 'Very High', 'Low', 'Low',
             'Moderate', 'High', 'High', 'Low', 'High', 'Moderate', 'Low', 'High',
             'Low', 'Moderate', 'Low', 'Low', 'Low', 'Low', 'Moderate', 'Low', 'Moderate', 'Moderate'
-        ]
+        ], categories=['Low', 'Moderate', 'High', 'Very High'], ordered=True)
     }
 
-    base_df = pd.read_csv('./data/college_salary_data.csv')
+    base_df = read_salary_source()
     enh_data = pd.DataFrame(data)
 
     # Add Enhanced Data
     df = base_df.join(enh_data)
 
-    # Calculate additional metrics
-    df['Mid-Career 10th Percentile Salary'] = df['Mid-Career Median Salary'] * 0.7
-    df['Mid-Career 90th Percentile Salary'] = df['Mid-Career Median Salary'] * 1.8
-    df['Spread'] = df['Mid-Career 90th Percentile Salary'] - df['Mid-Career 10th Percentile Salary']
-    df['Salary Growth'] = df['Mid-Career Median Salary'] - df['Starting Median Salary']
-    df['Growth Percentage'] = (df['Salary Growth'] / df['Starting Median Salary']) * 100
-    
-    # Risk categories
-    df['Risk Level'] = pd.cut(df['Spread'], 
-                             bins=[0, 60000, 80000, float('inf')], 
-                             labels=['Low', 'Medium', 'High'])
-    
+    # Calculate additional metrics on the raw arrays in one pass; float32 is ample
+    # for whole dollars and one-decimal scores
+    start = df['Starting Median Salary'].to_numpy(dtype=np.float32)
+    mid = df['Mid-Career Median Salary'].to_numpy(dtype=np.float32)
+    job_satisfaction = df['Job_Satisfaction_Score'].to_numpy(dtype=np.float32)
+    work_life_balance = df['Work_Life_Balance'].to_numpy(dtype=np.float32)
+    p10 = mid * np.float32(0.7)
+    p90 = mid * np.float32(1.8)
+    spread = p90 - p10
+    growth = mid - start
+    growth_pct = growth / start * np.float32(100.0)
+
+    # Risk categories based on spread: (0, 60k] Low, (60k, 80k] Medium, above High
+    risk_codes = np.searchsorted(RISK_BIN_EDGES, spread).astype(np.int8)
+
     # Career satisfaction composite score
-    df['Career_Satisfaction_Score'] = (
-        df['Job_Satisfaction_Score'] * 0.4 + 
-        df['Work_Life_Balance'] * 0.3 + 
-        df['Mid-Career Median Salary'] / 10000 * 0.3
-    ).round(1)
-    
+    satisfaction = np.round(
+        job_satisfaction * np.float32(0.4) +
+        work_life_balance * np.float32(0.3) +
+        mid / np.float32(10000.0) * np.float32(0.3),
+        1
+    )
+
+    df = df.assign(**{
+        # Low-cardinality group label as a categorical
+        'Group': df['Group'].astype('category'),
+        'Starting Median Salary': start,
+        'Mid-Career Median Salary': mid,
+        'Mid-Career 10th Percentile Salary': p10,
+        'Mid-Career 90th Percentile Salary': p90,
+        'Spread': spread,
+        'Salary Growth': growth,
+        'Growth Percentage': growth_pct,
+        'Risk Level': pd.Categorical.from_codes(risk_codes, categories=['Low', 'Medium', 'High'], ordered=True),
+        'Career_Satisfaction_Score': satisfaction,
+    })
+
     return df
 
 
-def get_personality_recommendations():
-    """Career recommendations based on personality types"""
-    return {
-        'Analytical': {
-            'description': 'Detail-oriented, logical thinkers who enjoy problem-solving',
-            'recommended_majors': ['Computer Science', 'Mathematics', 'Physics', 'Economics', 'Engineering'],
-            'strengths': ['Problem-solving', 'Data analysis', 'Critical thinking'],
-            'growth_areas': ['Communication', 'Leadership', 'Creativity']
-        },
-        'Creative': {
-            'description': 'Innovative, artistic individuals who value self-expression',
-            'recommended_majors': ['Drama', 'Film', 'Graphic Design', 'Architecture', 'English', 'Music'],
-            'strengths': ['Innovation', 'Communication', 'Adaptability'],
-            'growth_areas': ['Technical skills', 'Financial planning', 'Structure']
-        },
-        'People-Oriented': {
-            'description': 'Empathetic individuals who enjoy helping and working with others',
-            'recommended_majors': ['Psychology', 'Education', 'Nursing', 'Sociology', 'Communications', 'Hospitality & Tourism'],
-            'strengths': ['Teamwork', 'Communication', 'Empathy'],
-            'growth_areas': ['Technical skills', 'Data analysis', 'Business acumen']
-        },
-        'Business-Minded': {
-            'description': 'Strategic thinkers focused on efficiency and results',
-            'recommended_majors': ['Business Management', 'Finance', 'Marketing', 'Economics', 'Accounting'],
-            'strengths': ['Leadership', 'Strategic thinking', 'Negotiation'],
-            'growth_areas': ['Technical skills', 'Creativity', 'Work-life balance']
-        }
+@st.cache_resource
+def major_options():
+    """All major names as an immutable tuple for the comparison multiselect"""
+    return tuple(load_enhanced_college_data()['Undergraduate Major'])
+
+
+# Career recommendations based on personality types
+PERSONALITY_TYPES = {
+    'Analytical': {
+        'description': 'Detail-oriented, logical thinkers who enjoy problem-solving',
+        'recommended_majors': ['Computer Science', 'Mathematics', 'Physics', 'Economics', 'Engineering'],
+        'strengths': ['Problem-solving', 'Data analysis', 'Critical thinking'],
+        'growth_areas': ['Communication', 'Leadership', 'Creativity']
+    },
+    'Creative': {
+        'description': 'Innovative, artistic individuals who value self-expression',
+        'recommended_majors': ['Drama', 'Film', 'Graphic Design', 'Architecture', 'English', 'Music'],
+        'strengths': ['Innovation', 'Communication', 'Adaptability'],
+        'growth_areas': ['Technical skills', 'Financial planning', 'Structure']
+    },
+    'People-Oriented': {
+        'description': 'Empathetic individuals who enjoy helping and working with others',
+        'recommended_majors': ['Psychology', 'Education', 'Nursing', 'Sociology', 'Communications', 'Hospitality & Tourism'],
+        'strengths': ['Teamwork', 'Communication', 'Empathy'],
+        'growth_areas': ['Technical skills', 'Data analysis', 'Business acumen']
+    },
+    'Business-Minded': {
+        'description': 'Strategic thinkers focused on efficiency and results',
+        'recommended_majors': ['Business Management', 'Finance', 'Marketing', 'Economics', 'Accounting'],
+        'strengths': ['Leadership', 'Strategic thinking', 'Negotiation'],
+        'growth_areas': ['Technical skills', 'Creativity', 'Work-life balance']
     }
+}
 
-def calculate_major_score(row, priorities):
-    """Calculate weighted score based on user priorities"""
-    score = 0
+# Personality matchers compiled once: any word of a recommended field, plus the
+# lowercased field text for majors named inside a field (e.g. 'Math' in 'Mathematics')
+PERSONALITY_PATTERNS = {
+    ptype: re.compile(
+        '|'.join(map(re.escape, dict.fromkeys(' '.join(info['recommended_majors']).lower().split()))),
+        re.IGNORECASE
+    )
+    for ptype, info in PERSONALITY_TYPES.items()
+}
+PERSONALITY_FIELDS_TEXT = {
+    ptype: '\n'.join(info['recommended_majors']).lower()
+    for ptype, info in PERSONALITY_TYPES.items()
+}
 
-    # Normalize salary to prevent bias toward high earners (30k-110k range)
-    salary_normalized = (row['Mid-Career Median Salary'] - 30000) / 80000
-    salary_normalized = max(0, min(1, salary_normalized))  # Clamp to 0-1
-    
-    # Normalize growth percentage (typical range 0-200%)
-    growth_normalized = row['Growth Percentage'] / 200
-    growth_normalized = max(0, min(1, growth_normalized))  # Clamp to 0-1
-    
-    # Satisfaction is already on 0-10 scale, normalize to 0-1
-    satisfaction_normalized = row['Career_Satisfaction_Score'] / 10
-    
-    # Apply weights - ensure they add up to 1.0
+# Personality cards are static, so render each one once
+PERSONALITY_CARD_HTML = {
+    ptype: f"""
+    <div class="personality-match">
+        <h4>{ptype} Type</h4>
+        <p>{info['description']}</p>
+        <strong>Your Strengths:</strong>
+        <ul>
+            {''.join([f'<li>{strength}</li>' for strength in info['strengths']])}
+        </ul>
+        <strong>Recommended Fields:</strong>
+        <ul>
+            {''.join([f'<li>{field}</li>' for field in info['recommended_majors'][:5]])}
+        </ul>
+    </div>
+    """
+    for ptype, info in PERSONALITY_TYPES.items()
+}
+
+
+@st.cache_resource
+def score_feature_matrix():
+    """Normalized salary, growth and satisfaction per major as a read-only N x 3 float32 matrix"""
+    df = load_enhanced_college_data()
+
+    # Normalize salary (30k-110k range) and growth (0-200%) to 0-1; satisfaction is on a 0-10 scale
+    features = np.column_stack([
+        np.clip((df['Mid-Career Median Salary'].to_numpy() - np.float32(30000.0)) / np.float32(80000.0), 0, 1),
+        np.clip(df['Growth Percentage'].to_numpy() / np.float32(200.0), 0, 1),
+        df['Career_Satisfaction_Score'].to_numpy() / np.float32(10.0),
+    ]).astype(np.float32)
+    features.flags.writeable = False
+    return features
+
+
+@st.cache_data
+def compute_base_scores(priorities_items):
+    """Priority-weighted score per major, before any personality bonus"""
+    priorities = dict(priorities_items)
+
+    # Score is a weighted sum of the normalized features: one matrix-vector product
     total_weight = priorities['salary'] + priorities['growth'] + priorities['satisfaction']
-    if total_weight > 0:
-        salary_weight = priorities['salary'] / total_weight
-        growth_weight = priorities['growth'] / total_weight
-        satisfaction_weight = priorities['satisfaction'] / total_weight
-        
-        score = (salary_normalized * salary_weight + 
-                growth_normalized * growth_weight + 
-                satisfaction_normalized * satisfaction_weight)
-    else:
-        # Equal weighting if no priorities set
-        score = (salary_normalized + growth_normalized + satisfaction_normalized) / 3
-    
-    return score
+    weights = np.array(
+        [priorities['salary'], priorities['growth'], priorities['satisfaction']],
+        dtype=np.float32
+    ) / np.float32(total_weight)
+    return score_feature_matrix() @ weights
+
+
+@st.cache_data
+def personality_match_mask(personality):
+    """Boolean mask of the majors matching a personality type"""
+    majors = load_enhanced_college_data()['Undergraduate Major']
+
+    # Match when a recommended field shares a word with the major, or contains the major itself
+    majors_lower = majors.str.lower().to_numpy(dtype=str)
+    return (majors.str.contains(PERSONALITY_PATTERNS[personality]).to_numpy() |
+            (np.char.find(PERSONALITY_FIELDS_TEXT[personality], majors_lower) >= 0))
+
+
+def score_dataframe(priorities_items, personality):
+    """Personalized score per major and the majors matching the personality type
+
+    Base scores and the match mask are cached separately, so changing only the
+    personality reuses the weighted scores and just reapplies the bonus.
+    """
+    df = load_enhanced_college_data()
+    scores = compute_base_scores(priorities_items)
+    match_mask = personality_match_mask(personality)
+
+    # Apply significant bonus for personality match
+    personality_bonus = 0.3  # Increased to 30% bonus for personality match
+    scores = np.where(match_mask, np.minimum(scores + personality_bonus, 1.0), scores)
+    personality_matches = df.loc[match_mask, 'Undergraduate Major'].tolist()
+
+    # Don't cap at 1.0 yet - let personality matches stand out
+    scores = np.minimum(scores, 1.5)  # Allow higher scores for personality matches
+
+    return scores, personality_matches
 
 
 def main():
     # Header
-    st.markdown("""
-    <div class="guidance-header">
-        <h1>🎯 Career Guidance & Decision Tool</h1>
-        <h2>Personalized Major Recommendations</h2>
-        <p>Find the right major based on your priorities, personality, and career goals</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(GUIDANCE_HEADER_HTML, unsafe_allow_html=True)
     
-    # Load data
+    # Load data (shared across sessions via cache_resource - never modify in place)
     df = load_enhanced_college_data()
-    personality_types = get_personality_recommendations()
     
     # Career Assessment Section
     st.header("🧭 Career Assessment")
@@ -233,59 +293,20 @@ def main():
         st.subheader("🧠 Personality Type")
         selected_personality = st.selectbox(
             "Which best describes you?",
-            options=list(personality_types.keys()),
+            options=list(PERSONALITY_TYPES.keys()),
             help="Select the personality type that best matches your preferences"
         )
         
         if selected_personality:
-            personality_info = personality_types[selected_personality]
-            st.markdown(f"""
-            <div class="personality-match">
-                <h4>{selected_personality} Type</h4>
-                <p>{personality_info['description']}</p>
-                <strong>Your Strengths:</strong>
-                <ul>
-                    {''.join([f'<li>{strength}</li>' for strength in personality_info['strengths']])}
-                </ul>
-                <strong>Recommended Fields:</strong>
-                <ul>
-                    {''.join([f'<li>{field}</li>' for field in personality_info['recommended_majors'][:5]])}
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(PERSONALITY_CARD_HTML[selected_personality], unsafe_allow_html=True)
         
         # Add refresh button for immediate feedback
         if st.button("🔄 Update Recommendations", help="Click to see how your changes affect the recommendations"):
             st.rerun()
     
-    # Calculate personalized recommendations
-    df['Personalized_Score'] = df.apply(lambda row: calculate_major_score(row, priorities), axis=1)
-    
-    # Personality-based filtering
-    personality_majors = personality_types[selected_personality]['recommended_majors']
-    personality_bonus = 0.3  # Increased to 30% bonus for personality match
-    
-    # # Debug: Show personality matching
-    # st.write(f"**🧠 Personality Type: {selected_personality}**")
-    # st.write(f"**Recommended Major Types:** {', '.join(personality_majors)}")
-    
-    personality_matches = []
-    for idx, row in df.iterrows():
-        major_name = row['Undergraduate Major']
-        is_match = False
-        
-        # Improved matching logic - check for key terms
-        for rec_major in personality_majors:
-            if (rec_major.lower() in major_name.lower() or 
-                major_name.lower() in rec_major.lower() or
-                any(word in major_name.lower() for word in rec_major.lower().split())):
-                is_match = True
-                personality_matches.append(major_name)
-                break
-        
-        if is_match:
-            # Apply significant bonus for personality match
-            df.at[idx, 'Personalized_Score'] = min(1.0, df.at[idx, 'Personalized_Score'] + personality_bonus)
+    # Score every major for these priorities and personality (cached per slider configuration)
+    personality_scores, personality_matches = score_dataframe(tuple(sorted(priorities.items())), selected_personality)
+    scored = df.assign(Personalized_Score=personality_scores)
     
     # Show which majors got personality bonuses
     if personality_matches:
@@ -293,13 +314,10 @@ def main():
     else:
         st.warning("No exact personality matches found - recommendations based on priorities only")
     
-    # Don't cap at 1.0 yet - let personality matches stand out
-    df['Personalized_Score'] = df['Personalized_Score'].clip(upper=1.5)  # Allow higher scores for personality matches
-    
     # Top Recommendations
     st.header("🌟 Your Personalized Recommendations")
     
-    top_recommendations = df.nlargest(10, 'Personalized_Score')
+    top_recommendations = top_k(scored, 'Personalized_Score', 10)
     
     # Debug information to show what's affecting rankings
     with st.expander("🔍 See How Rankings Are Calculated"):
@@ -324,34 +342,47 @@ def main():
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        # Recommendation chart
-        fig_rec = px.bar(
-            top_recommendations.head(8),
-            x='Personalized_Score',
-            y='Undergraduate Major',
-            color='Group',
+        # Recommendation chart, one bar trace per group so the legend stays
+        top_eight = top_recommendations.head(8)
+        rec_groups = top_eight['Group'].to_numpy()
+        rec_scores = top_eight['Personalized_Score'].to_numpy()
+        rec_majors = top_eight['Undergraduate Major'].to_numpy()
+        fig_rec = go.Figure(layout=dict(
             title='Top Major Recommendations for You',
-            orientation='h',
-            color_discrete_map={
-                'STEM': '#10B981',
-                'Business': '#3B82F6',
-                'HASS': '#8B5CF6'
-            }
-        )
-        fig_rec.update_layout(height=500, yaxis={'categoryorder': 'total ascending'})
+            height=500,
+            barmode='relative',
+            legend_title_text='Group',
+            xaxis_title='Personalized_Score',
+            yaxis={'title': 'Undergraduate Major', 'categoryorder': 'total ascending'}
+        ))
+        for group, color in GROUP_COLORS.items():
+            in_group = rec_groups == group
+            if in_group.any():
+                fig_rec.add_trace(go.Bar(
+                    x=rec_scores[in_group],
+                    y=rec_majors[in_group],
+                    orientation='h',
+                    name=group,
+                    marker_color=color
+                ))
         st.plotly_chart(fig_rec, use_container_width=True)
     
     with col2:
         st.write("**🏆 Your Top 5 Matches:**")
-        for i, (_, row) in enumerate(top_recommendations.head(5).iterrows(), 1):
-            match_percentage = row['Personalized_Score'] * 100
-            st.write(f"""
-            **{i}. {row['Undergraduate Major']}** ({row['Group']})
-            - Match: {match_percentage:.0f}%
-            - Starting: ${row['Starting Median Salary']:,}
-            - Mid-Career: ${row['Mid-Career Median Salary']:,}
-            - Satisfaction: {row['Career_Satisfaction_Score']}/10
-            """)
+        # One markdown element for all five; blank lines keep each block (and its $ signs) separate
+        st.markdown('\n\n'.join(
+            f"**{i}. {major}** ({group})\n"
+            f"- Match: {score * 100:.0f}%\n"
+            f"- Starting: ${start:,.0f}\n"
+            f"- Mid-Career: ${mid:,.0f}\n"
+            f"- Satisfaction: {satisfaction:.1f}/10"
+            for i, (major, group, score, start, mid, satisfaction) in enumerate(
+                top_recommendations.head(5)[['Undergraduate Major', 'Group', 'Personalized_Score',
+                                             'Starting Median Salary', 'Mid-Career Median Salary',
+                                             'Career_Satisfaction_Score']].itertuples(index=False, name=None),
+                1
+            )
+        ))
     
     # Detailed Analysis Tabs
     st.header("📊 Detailed Analysis")
@@ -366,21 +397,27 @@ def main():
         
         with col1:
             st.write("**💰 If Salary Was Your Top Priority:**")
-            salary_focused = df.nlargest(5, 'Mid-Career Median Salary')[['Undergraduate Major', 'Mid-Career Median Salary']]
-            for _, row in salary_focused.iterrows():
-                st.write(f"• {row['Undergraduate Major']}: ${row['Mid-Career Median Salary']:,}")
+            salary_focused = top_k(scored, 'Mid-Career Median Salary', 5)[['Undergraduate Major', 'Mid-Career Median Salary']]
+            st.markdown('\n\n'.join(
+                f"• {major}: ${salary:,.0f}"
+                for major, salary in salary_focused.itertuples(index=False, name=None)
+            ))
         
         with col2:
             st.write("**📈 If Growth Was Your Top Priority:**")
-            growth_focused = df.nlargest(5, 'Growth Percentage')[['Undergraduate Major', 'Growth Percentage']]
-            for _, row in growth_focused.iterrows():
-                st.write(f"• {row['Undergraduate Major']}: +{row['Growth Percentage']:.0f}%")
+            growth_focused = top_k(scored, 'Growth Percentage', 5)[['Undergraduate Major', 'Growth Percentage']]
+            st.markdown('\n\n'.join(
+                f"• {major}: +{growth:.0f}%"
+                for major, growth in growth_focused.itertuples(index=False, name=None)
+            ))
         
         with col3:
             st.write("**😊 If Satisfaction Was Your Top Priority:**")
-            satisfaction_focused = df.nlargest(5, 'Career_Satisfaction_Score')[['Undergraduate Major', 'Career_Satisfaction_Score']]
-            for _, row in satisfaction_focused.iterrows():
-                st.write(f"• {row['Undergraduate Major']}: {row['Career_Satisfaction_Score']}/10")
+            satisfaction_focused = top_k(scored, 'Career_Satisfaction_Score', 5)[['Undergraduate Major', 'Career_Satisfaction_Score']]
+            st.markdown('\n\n'.join(
+                f"• {major}: {satisfaction:.1f}/10"
+                for major, satisfaction in satisfaction_focused.itertuples(index=False, name=None)
+            ))
         
         # Priority visualization
         st.subheader("Your Priority Breakdown")
@@ -395,38 +432,58 @@ def main():
         st.subheader("📈 Career Outlook Analysis")
         
         # Job growth outlook analysis
-        outlook_counts = df.groupby(['Group', 'Job_Growth_Outlook']).size().reset_index(name='count')
+        outlook_counts = scored.groupby(['Job_Growth_Outlook', 'Group'], observed=True).size().unstack(fill_value=0)
         
-        fig_outlook = px.bar(
-            outlook_counts,
-            x='Group',
-            y='count',
-            color='Job_Growth_Outlook',
+        fig_outlook = go.Figure(layout=dict(
             title='Job Growth Outlook by Major Group',
-            color_discrete_map={
-                'Very High': '#10B981',
-                'High': '#22C55E',
-                'Moderate': '#F59E0B',
-                'Low': '#EF4444'
-            }
-        )
+            barmode='relative',
+            legend_title_text='Job_Growth_Outlook',
+            xaxis_title='Group',
+            yaxis_title='count'
+        ))
+        for outlook, color in OUTLOOK_COLORS.items():
+            if outlook in outlook_counts.index:
+                fig_outlook.add_trace(go.Bar(
+                    x=outlook_counts.columns.to_numpy(),
+                    y=outlook_counts.loc[outlook].to_numpy(),
+                    name=outlook,
+                    marker_color=color
+                ))
         st.plotly_chart(fig_outlook, use_container_width=True)
         
         # Satisfaction vs Salary scatter
-        fig_sat_sal = px.scatter(
-            df,
-            x='Career_Satisfaction_Score',
-            y='Mid-Career Median Salary',
-            color='Group',
-            size='Work_Life_Balance',
-            hover_name='Undergraduate Major',
+        groups = scored['Group'].to_numpy()
+        satisfaction = scored['Career_Satisfaction_Score'].to_numpy()
+        mid_salary = scored['Mid-Career Median Salary'].to_numpy()
+        balance = scored['Work_Life_Balance'].to_numpy()
+        majors = scored['Undergraduate Major'].to_numpy()
+        # Same area scaling px uses: the largest marker gets a 20px diameter
+        size_ref = balance.max() / 20 ** 2
+        
+        fig_sat_sal = go.Figure(layout=dict(
             title='Career Satisfaction vs Salary (size = work-life balance)',
-            color_discrete_map={
-                'STEM': '#10B981',
-                'Business': '#3B82F6',
-                'HASS': '#8B5CF6'
-            }
-        )
+            legend={'title_text': 'Group', 'itemsizing': 'constant'},
+            xaxis_title='Career_Satisfaction_Score',
+            yaxis_title='Mid-Career Median Salary'
+        ))
+        for group, color in GROUP_COLORS.items():
+            in_group = groups == group
+            fig_sat_sal.add_trace(go.Scatter(
+                x=satisfaction[in_group],
+                y=mid_salary[in_group],
+                mode='markers',
+                name=group,
+                hovertext=majors[in_group],
+                hovertemplate='<b>%{hovertext}</b><br>Career Satisfaction: %{x:.1f}/10'
+                              '<br>Mid-Career Median Salary: %{y:$,.0f}'
+                              '<br>Work-Life Balance: %{marker.size:.1f}/10<extra>%{fullData.name}</extra>',
+                marker=dict(
+                    color=color,
+                    size=balance[in_group],
+                    sizemode='area',
+                    sizeref=size_ref
+                )
+            ))
         st.plotly_chart(fig_sat_sal, use_container_width=True)
     
     with tab3:
@@ -435,12 +492,12 @@ def main():
         # Select majors for detailed comparison
         selected_majors = st.multiselect(
             "Select majors to compare in detail:",
-            options=df['Undergraduate Major'].tolist(),
+            options=major_options(),
             default=top_recommendations.head(3)['Undergraduate Major'].tolist()
         )
         
         if selected_majors:
-            comparison_df = df[df['Undergraduate Major'].isin(selected_majors)].copy()
+            comparison_df = scored[scored['Undergraduate Major'].isin(selected_majors)].copy()
             
             # Radar chart for multi-factor comparison
             categories = ['Starting Salary (normalized)', 'Mid-Career Salary (normalized)', 
@@ -448,20 +505,23 @@ def main():
             
             fig_radar = go.Figure()
             
-            for _, row in comparison_df.iterrows():
-                values = [
-                    (row['Starting Median Salary'] - df['Starting Median Salary'].min()) / (df['Starting Median Salary'].max() - df['Starting Median Salary'].min()) * 10,
-                    (row['Mid-Career Median Salary'] - df['Mid-Career Median Salary'].min()) / (df['Mid-Career Median Salary'].max() - df['Mid-Career Median Salary'].min()) * 10,
-                    row['Job_Satisfaction_Score'],
-                    row['Work_Life_Balance'], 
-                    row['Growth Percentage'] / 10
-                ]
-                
+            # Scale both salaries against the full range once, then build all rows' values together
+            s_min, s_max = scored['Starting Median Salary'].agg(['min', 'max'])
+            m_min, m_max = scored['Mid-Career Median Salary'].agg(['min', 'max'])
+            values_matrix = np.column_stack([
+                (comparison_df['Starting Median Salary'].to_numpy() - s_min) / (s_max - s_min) * 10,
+                (comparison_df['Mid-Career Median Salary'].to_numpy() - m_min) / (m_max - m_min) * 10,
+                comparison_df['Job_Satisfaction_Score'].to_numpy(),
+                comparison_df['Work_Life_Balance'].to_numpy(),
+                comparison_df['Growth Percentage'].to_numpy() / 10
+            ])
+            
+            for major, values in zip(comparison_df['Undergraduate Major'], values_matrix):
                 fig_radar.add_trace(go.Scatterpolar(
                     r=values,
                     theta=categories,
                     fill='toself',
-                    name=row['Undergraduate Major']
+                    name=major
                 ))
             
             fig_radar.update_layout(
@@ -530,7 +590,7 @@ def main():
             <h4>⚠️ Consider Also</h4>
             <ul>
                 <li><strong>Backup Options:</strong> {', '.join(top_recommendations.iloc[1:4]['Undergraduate Major'].tolist())}</li>
-                <li><strong>Skill Development:</strong> {', '.join(personality_types[selected_personality]['growth_areas'])}</li>
+                <li><strong>Skill Development:</strong> {', '.join(PERSONALITY_TYPES[selected_personality]['growth_areas'])}</li>
                 <li><strong>Risk Level:</strong> {top_choice['Risk Level']} salary variability</li>
                 <li><strong>Location Impact:</strong> Salaries vary significantly by region</li>
             </ul>
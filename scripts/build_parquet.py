@@ -0,0 +1,36 @@
+"""Convert the college salary CSV into the Parquet file loaded by the dashboard
+
+Run from the repository root whenever data/college_salary_data.csv changes:
+
+    python scripts/build_parquet.py
+"""
+from pathlib import Path
+
+import pandas as pd
+
+
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+CSV_PATH = DATA_DIR / 'college_salary_data.csv'
+PARQUET_PATH = DATA_DIR / 'college_salary_data.parquet'
+
+# Explicit column types so neither the CSV parse nor the Parquet read has to infer them
+CSV_DTYPES = {
+    'Undergraduate Major': 'category',
+    'Starting Median Salary': 'int32',
+    'Mid-Career Median Salary': 'int32',
+    'Mid-Career 10th Percentile Salary': 'int32',
+    'Mid-Career 90th Percentile Salary': 'int32',
+    'Group': 'category',
+}
+
+
+def build_parquet():
+    """Parse the CSV once and persist it as zstd-compressed Parquet"""
+    df = pd.read_csv(CSV_PATH, dtype=CSV_DTYPES, engine='pyarrow')
+    df.to_parquet(PARQUET_PATH, engine='pyarrow', compression='zstd', index=False)
+    return df
+
+
+if __name__ == "__main__":
+    df = build_parquet()
+    print(f"Wrote {len(df)} majors to {PARQUET_PATH}")